@@ -0,0 +1,208 @@
+"""
+Optional `aiohttp`-backed variant of the client.
+
+Install the `async` extra to use it:
+
+```sh
+pip install pydevice42[async]
+```
+
+Bulk getters (`get_all_devices` and friends) fetch thousands of rows;
+doing that through blocking sockets means paying one round-trip per
+page. Here every page after the first is awaited through a single
+`aiohttp.ClientSession`, so the whole listing costs roughly one
+round-trip regardless of page count.
+"""
+
+import asyncio
+import typing as t
+
+import aiohttp
+
+from . import exceptions as d42exc
+from . import types as tt
+from .d42client import _DOQL_BASE, extract_data
+from .logger import LOGGER
+
+# Mirrors the sync client's retry policy; 500 is absent because
+# Device42 uses it for application errors (e.g. expired licenses)
+# that we must inspect, not retry
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+_MAX_RETRIES = 3
+_BACKOFF_FACTOR = 0.3
+
+
+class AsyncD42Client:
+    """
+    `asyncio` counterpart to `D42Client` for the bulk read paths.
+
+    Meant to be used as an async context manager so the underlying
+    `aiohttp.ClientSession` (and its keep-alive connections) live for
+    the whole batch:
+
+    ```python
+    async with AsyncD42Client(host, user, password) as client:
+        async for device in client.get_all_devices():
+            ...
+    ```
+    """
+
+    def __init__(
+        self,
+        hostname: str,
+        username: str,
+        password: str,
+        insecure: bool = False,
+        port: int = 443,
+        limit_per_host: int = 64,
+    ) -> None:
+        self._hostname = hostname
+        self._auth = aiohttp.BasicAuth(username, password)
+        self._insecure = insecure
+        self._port = port
+        self._limit_per_host = limit_per_host
+        self._session: t.Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "AsyncD42Client":
+        await self._ensure_session()
+        return self
+
+    async def __aexit__(self, *exc_info: t.Any) -> None:
+        await self.close()
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            # Only override ssl when certificate checking is disabled;
+            # aiohttp rejects ssl=None
+            connector_kwargs: t.Dict[str, t.Any] = (
+                {"ssl": False} if self._insecure else {}
+            )
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self._limit_per_host,
+                keepalive_timeout=75,
+                **connector_kwargs,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector, auth=self._auth
+            )
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def _request(
+        self,
+        endpoint: str,
+        params: t.Optional[t.Dict[str, t.Any]] = None,
+    ) -> tt.JSON_Res:
+        """
+        GET `endpoint` and decode the JSON body.
+
+        Transient statuses are retried with exponential backoff; 500s
+        are checked for Device42's license errors, like in the sync
+        client.
+        """
+        session = await self._ensure_session()
+        url = f"https://{self._hostname}:{self._port}{endpoint}"
+        # aiohttp refuses None values, whereas requests silently drops
+        # them; keep the sync client's laissez-faire call sites working
+        params = {k: v for k, v in (params or {}).items() if v is not None}
+        for attempt in range(_MAX_RETRIES + 1):
+            async with session.get(url, params=params) as res:
+                if res.status in _RETRY_STATUSES and attempt < _MAX_RETRIES:
+                    delay = _BACKOFF_FACTOR * (2**attempt)
+                    LOGGER.debug(
+                        f"Got {res.status} for {endpoint}, "
+                        f"retrying in {delay}s"
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                if res.status == 500:
+                    try:
+                        msg = (await res.json(content_type=None)).get("msg", "")
+                        if msg.startswith("License expired"):
+                            raise d42exc.LicenseExpiredException(msg)
+                        elif msg.startswith("License is not valid for"):
+                            raise d42exc.LicenseInsufficientException(msg)
+                    except (ValueError, AttributeError):
+                        # The backend may not talk JSON when returning
+                        # 500's
+                        pass
+                res.raise_for_status()
+                return await res.json(content_type=None)
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def _paginated_request(
+        self,
+        endpoint: str,
+        params: t.Optional[t.Dict[str, t.Any]] = None,
+        limit: int = 50,
+    ) -> t.AsyncIterator[tt.JSON_Res]:
+        """
+        Fetch the first page to learn `total_count`, then gather every
+        remaining offset concurrently. Pages after the first may arrive
+        out of order.
+        """
+        params = {} if params is None else params
+        resp = await self._request(
+            endpoint, {**params, "limit": limit, "offset": 0}
+        )
+        resp_data: t.Any = extract_data(resp)
+        if not resp_data:
+            return
+
+        total_count = int(resp["total_count"])
+
+        yield resp_data
+
+        offsets = range(limit, total_count, limit)
+        if not offsets:
+            return
+        pages = await asyncio.gather(
+            *(
+                self._request(
+                    endpoint, {**params, "limit": limit, "offset": offset}
+                )
+                for offset in offsets
+            )
+        )
+        for page in pages:
+            yield extract_data(page)
+
+    async def _flattened_paginated_request(
+        self, *args: t.Any, **kwargs: t.Any
+    ) -> t.AsyncIterator[tt.JSON_Res]:
+        async for page in self._paginated_request(*args, **kwargs):
+            for row in page:
+                yield row
+
+    def get_devices(self, **kwargs: tt.DeviceGet) -> t.AsyncIterator[tt.Device]:
+        return self._flattened_paginated_request(
+            "/api/1.0/devices/", params=kwargs
+        )
+
+    def get_all_devices(
+        self, include_cols: t.Optional[str] = None
+    ) -> t.AsyncIterator[tt.Device]:
+        return self._flattened_paginated_request(
+            "/api/1.0/devices/all", params={"include_cols": include_cols}
+        )
+
+    def get_all_service_instances(self) -> t.AsyncIterator[tt.JSON_Res]:
+        return self._flattened_paginated_request("/api/2.0/service_instances/")
+
+    def get_all_application_components(self) -> t.AsyncIterator[tt.JSON_Res]:
+        return self._flattened_paginated_request("/api/1.0/appcomps/")
+
+    def get_all_operating_systems(self) -> t.AsyncIterator[tt.JSON_Res]:
+        return self._flattened_paginated_request("/api/1.0/operatingsystems/")
+
+    async def get_DOQL_query(self, query_name: str) -> t.Any:
+        """
+        See `D42Client.get_DOQL_query`.
+        """
+        return await self._request(
+            "/services/data/v1.0/query/",
+            params=dict(_DOQL_BASE, saved_query_name=query_name),
+        )
@@ -3,10 +3,36 @@ import typing as t
 
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from . import types as tt
 from .logger import LOGGER
 
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]
+
+try:
+    # urllib3 can only decode Brotli bodies when a brotli
+    # implementation is importable, so only advertise it then
+    import brotli  # noqa: F401
+
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:  # pragma: no cover
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+# `raise_for_status` raises one of these depending on the transport in
+# use; both expose `.response`. Left unannotated on purpose: spelling
+# it as Tuple[Type[Exception], ...] would make `except HTTP_ERRORS as
+# err` infer plain Exception and lose `.response`
+HTTP_ERRORS = (
+    (requests.HTTPError,)
+    if httpx is None
+    else (requests.HTTPError, httpx.HTTPStatusError)
+)
+
 
 class BasicRestClient:
     """The requests library handles mantaining a session alive and cookies for
@@ -22,17 +48,62 @@ class BasicRestClient:
         password: str,
         insecure: bool = False,
         port: int = 443,
+        http2: bool = False,
     ) -> None:
+        """
+        With `http2=True` (needs the `http2` extra) requests are sent
+        through an `httpx.Client` that multiplexes everything — notably
+        the concurrent pagination workers — over a single HTTP/2 TLS
+        connection, instead of one HTTP/1.1 socket per worker.
+        Streaming requests still go through the `requests` session,
+        which exposes the file-like raw body they need.
+        """
         self._username = username
         self._password = password
         self._hostname = hostname
         self._insecure = insecure
         self._port = port
         self.session: requests.Session = self.prepareSession()
+        self._http2_client: t.Optional["httpx.Client"] = None
+        if http2:
+            if httpx is None:
+                raise ImportError(
+                    "HTTP/2 support requires the httpx package "
+                    "(pip install pydevice42[http2])"
+                )
+            self._http2_client = httpx.Client(
+                http2=True,
+                auth=(username, password),
+                verify=not insecure,
+                limits=httpx.Limits(
+                    max_keepalive_connections=1, max_connections=1
+                ),
+                timeout=30.0,
+            )
 
     def prepareSession(self) -> requests.Session:
         s = requests.Session()
         s.auth = (self._username, self._password)
+        # Mount a pooled adapter so every request (notably each page of a
+        # paginated one) reuses the same keep-alive TLS connection instead
+        # of redoing the TCP + TLS handshake.
+        # Transient server hiccups are retried with a small backoff.
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                # 500 is deliberately absent: Device42 uses it for
+                # application errors (e.g. expired licenses) that
+                # `D42Client._request` must inspect, not retry
+                status_forcelist=[429, 502, 503, 504],
+            ),
+        )
+        s.mount("https://", adapter)
+        s.headers["Connection"] = "keep-alive"
+        # Device42 payloads are JSON and compress 5-10x
+        s.headers["Accept-Encoding"] = _ACCEPT_ENCODING
         if self._insecure:
             # Disable certificate warnings
             urllib3.disable_warnings()
@@ -45,9 +116,36 @@ class BasicRestClient:
         url: str,
         params: t.Optional[t.Dict[str, t.Any]] = None,
         json: t.Optional[t.Dict[str, t.Any]] = None,
-        data: t.Optional[t.Dict[str, t.Any]] = None,
+        data: t.Union[t.Mapping[str, t.Any], bytes, None] = None,
         method: tt.HTTP_METHODS = "GET",
-    ) -> requests.Response:
+        headers: t.Optional[t.Dict[str, str]] = None,
+        stream: bool = False,
+    ) -> t.Any:
+        if isinstance(data, bytes):
+            # Pre-serialized JSON body (see d42client._json_bytes);
+            # label it so the server doesn't assume form encoding
+            headers = dict(headers or {})
+            headers.setdefault("Content-Type", "application/json")
+        # Returns a requests.Response, or an httpx.Response in http2
+        # mode; the two expose the same interface for everything we use
+        if self._http2_client is not None and not stream:
+            h2res = self._http2_client.request(
+                method,
+                f"https://{self._hostname}:{self._port}{url}",
+                # httpx refuses None-valued params that requests would
+                # just drop
+                params={
+                    k: v for k, v in (params or {}).items() if v is not None
+                },
+                json=json,
+                # httpx takes pre-encoded bodies through content=,
+                # keeping data= for form mappings
+                content=data if isinstance(data, bytes) else None,
+                data=data if not isinstance(data, bytes) else None,
+                headers=headers,
+            )
+            LOGGER.debug(f"Request response: {h2res.text}")
+            return h2res
         request = functools.partial(
             self.session.request,
             method,
@@ -55,11 +153,18 @@ class BasicRestClient:
             params=params,
             json=json,
             data=data,
+            headers=headers,
+            stream=stream,
             verify=not self._insecure,
         )
         try:
             res = request()
-            LOGGER.debug(f"Request response: {res.text}")
+            if stream:
+                # Touching .text would download and drain the body
+                # that the streaming parser expects to find in res.raw
+                LOGGER.debug(f"Request response status: {res.status_code}")
+            else:
+                LOGGER.debug(f"Request response: {res.text}")
             return res
         except ConnectionResetError:
             """
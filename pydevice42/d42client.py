@@ -1,14 +1,48 @@
 import json as js
+import threading
 import typing as t
-from itertools import chain
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-import requests
+from cachetools import LRUCache, TTLCache
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
 
 from . import exceptions as d42exc
 from . import types as tt
-from .basicrestclient import BasicRestClient
+from .basicrestclient import HTTP_ERRORS, BasicRestClient
 from .logger import LOGGER
 
+_META_KEYS = frozenset({"offset", "total_count", "limit"})
+
+# Constant part of every DOQL query's params; only saved_query_name
+# varies per call
+_DOQL_BASE = {
+    "delimiter": "",
+    "header": "yes",
+    "output_type": "json",
+}
+
+
+def _json_bytes(obj: t.Mapping[str, t.Any]) -> bytes:
+    """
+    Serialize a POST/PUT body to JSON bytes up front, so `requests`
+    doesn't have to urlencode a many-field mapping on every write.
+
+    `default=str` mirrors what urlencoding did to non-JSON values like
+    the `IPAddress` TypedDict's `ipaddress` objects.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str)
+    return js.dumps(obj, default=str).encode()
+
 
 def extract_data(data: t.Dict[str, t.Any]) -> t.Any:
     """
@@ -25,12 +59,95 @@ def extract_data(data: t.Dict[str, t.Any]) -> t.Any:
     ```
 
     This function simply returns the first non-meta field.
+
+    The set difference runs entirely in C, unlike a per-key `not in`
+    scan, and this gets called once per page.
     """
-    metadata_keys = ["offset", "total_count", "limit"]
-    return data.get(next((k for k in data.keys() if k not in metadata_keys)))
+    payload_keys = data.keys() - _META_KEYS
+    return data[next(iter(payload_keys))] if payload_keys else None
 
 
 class D42Client(BasicRestClient):
+    def __init__(
+        self,
+        hostname: str,
+        username: str,
+        password: str,
+        insecure: bool = False,
+        port: int = 443,
+        http2: bool = False,
+        cache_ttl: int = 60,
+        cache_maxsize: int = 4096,
+    ) -> None:
+        """
+        GETs are idempotent, so their decoded responses are kept in a
+        TTL-bounded LRU cache keyed on `(endpoint, params)`. Repeating
+        the same lookup (or re-iterating a paginated request, since
+        every *page* is a cached GET) within `cache_ttl` seconds is a
+        dict lookup instead of an HTTPS round-trip.
+
+        Pass `cache_ttl=0` to disable caching entirely.
+        """
+        super().__init__(
+            hostname,
+            username,
+            password,
+            insecure=insecure,
+            port=port,
+            http2=http2,
+        )
+        self._cache: t.Optional[TTLCache] = (
+            TTLCache(maxsize=cache_maxsize, ttl=cache_ttl)
+            if cache_ttl > 0
+            else None
+        )
+        # TTLCache isn't thread-safe and _paginated_request hits the
+        # cache from worker threads
+        self._cache_lock = threading.Lock()
+        # Conditional-GET bookkeeping: (validator headers, last decoded
+        # payload) per (endpoint, params). When the TTL cache has gone
+        # stale but the resource hasn't changed, the server answers
+        # `304 Not Modified` and we reuse the stored payload without
+        # re-downloading or re-parsing it. LRU-bounded so long-running
+        # pollers don't accumulate every page they ever fetched.
+        self._conditional: LRUCache = LRUCache(maxsize=cache_maxsize)
+        # Resolved payload field per paginated endpoint ("devices",
+        # "racks", ...) so pages after the first are a plain dict lookup
+        self._payload_keys: t.Dict[str, str] = {}
+        # Formatted "/api/{version}/{endpoint}/" prefixes, so tight
+        # loops over the object helpers don't re-run the f-string
+        self._prefix_cache: t.Dict[t.Tuple[str, str], str] = {}
+
+    def _prefix(self, endpoint: str, api_version: str) -> str:
+        return self._prefix_cache.setdefault(
+            (endpoint, api_version), f"/api/{api_version}/{endpoint}/"
+        )
+
+    @staticmethod
+    def _cache_key(
+        endpoint: str, params: t.Optional[t.Dict[str, t.Any]]
+    ) -> t.Tuple[str, t.Tuple[t.Tuple[str, t.Any], ...]]:
+        return (endpoint, tuple(sorted((params or {}).items())))
+
+    def invalidate(self, endpoint: t.Optional[str] = None) -> None:
+        """
+        Drop cached GET responses; either everything, or only those for
+        `endpoint`. Useful right after POSTing/PUTting objects whose
+        listing you're about to re-read.
+        """
+        with self._cache_lock:
+            stores: t.Tuple[t.MutableMapping[t.Any, t.Any], ...] = (
+                self._conditional,
+            )
+            if self._cache is not None:
+                stores += (self._cache,)
+            for store in stores:
+                if endpoint is None:
+                    store.clear()
+                else:
+                    for key in [k for k in store if k[0] == endpoint]:
+                        del store[key]
+
     def _check_err(self, jres: t.Any) -> tt.JSON_Res:
         """POST and PUT method validation
 
@@ -40,41 +157,127 @@ class D42Client(BasicRestClient):
         This is _generally_ a t.List[t.Any], but I have generalised it to
         be any type of tt.JSON_Res
         """
-        ret_code = int(jres["code"])
-        ret_msg = jres.get("msg", [])
-        if ret_code != 0:
-            raise d42exc.ReturnCodeException(" ".join(map(str, ret_msg)))
-        return ret_msg
+        # The server usually sends the code as a real JSON number, so
+        # don't pay an int() conversion on every successful write; only
+        # the failure path builds the error message
+        ret_code = jres["code"]
+        if ret_code != 0 and ret_code != "0":
+            raise d42exc.ReturnCodeException(
+                " ".join(map(str, jres.get("msg", [])))
+            )
+        return jres.get("msg", [])
+
+    def _cache_lookup(
+        self, cache_key: t.Any
+    ) -> t.Tuple[tt.JSON_Res, t.Optional[t.Dict[str, str]]]:
+        """
+        Return `(cached payload, conditional headers)` for a GET.
+
+        A fresh TTL-cache hit comes back as the payload; otherwise the
+        stored `If-None-Match`/`If-Modified-Since` validators (if any)
+        are returned so the request can be made conditional.
+        """
+        with self._cache_lock:
+            if self._cache is not None:
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    return cached, None
+            entry = self._conditional.get(cache_key)
+            return None, entry[0] if entry is not None else None
+
+    def _store_cached(
+        self, cache_key: t.Any, res: t.Any, jres: tt.JSON_Res
+    ) -> None:
+        """
+        Remember a successful GET: the decoded payload in the TTL cache
+        and, when the server sent validators, the headers + payload for
+        later conditional requests.
+        """
+        validators = {}
+        if res.headers.get("ETag"):
+            validators["If-None-Match"] = res.headers["ETag"]
+        if res.headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = res.headers["Last-Modified"]
+        with self._cache_lock:
+            if self._cache is not None:
+                self._cache[cache_key] = jres
+            if validators:
+                self._conditional[cache_key] = (validators, jres)
+
+    def _raise_license_error(self, err: t.Any) -> None:
+        """
+        Re-raise Device42's 500-with-license-marker responses as their
+        specific exceptions; return for anything else so the caller can
+        re-raise the original error.
+
+        `err` is a requests.HTTPError or httpx.HTTPStatusError.
+        """
+        if err.response.status_code != 500:
+            return
+        # Look for the known license markers in the raw bytes instead
+        # of JSON-decoding every 500 body — the backend may not even
+        # talk JSON when returning 500's
+        body: bytes = err.response.content[:256]
+        if b"License expired" in body:
+            raise d42exc.LicenseExpiredException(err.response.text) from err
+        if b"License is not valid for" in body:
+            raise d42exc.LicenseInsufficientException(
+                err.response.text
+            ) from err
 
     def _request(
         self,
         endpoint: str,
         params: t.Optional[t.Dict[str, t.Any]] = None,
         json: t.Optional[t.Dict[str, t.Any]] = None,
-        data: t.Optional[t.Dict[str, t.Any]] = None,
+        data: t.Union[t.Mapping[str, t.Any], bytes, None] = None,
         method: tt.HTTP_METHODS = "GET",
     ) -> tt.JSON_Res:
+        cache_key = None
+        headers = None
+        if method == "GET":
+            cache_key = self._cache_key(endpoint, params)
+            cached, headers = self._cache_lookup(cache_key)
+            if cached is not None:
+                return cached
         res = self.request(
-            url=endpoint, params=params, json=json, data=data, method=method
+            url=endpoint,
+            params=params,
+            json=json,
+            data=data,
+            method=method,
+            headers=headers,
         )
+        if res.status_code == 304:
+            # Not Modified: reuse the previously decoded payload,
+            # skipping both the download and the JSON parse
+            with self._cache_lock:
+                entry = self._conditional.get(cache_key)
+            if entry is not None:
+                return entry[1]
+            # The LRU evicted the payload between sending the
+            # validators and the 304 arriving; fetch unconditionally
+            res = self.request(
+                url=endpoint,
+                params=params,
+                json=json,
+                data=data,
+                method=method,
+            )
         try:
             res.raise_for_status()
-        except requests.HTTPError as err:
-            if err.response.status_code == 500:
-                try:
-                    msg = err.response.json().get("msg", "")
-                    if msg.startswith("License expired"):
-                        raise d42exc.LicenseExpiredException(msg) from err
-                    elif msg.startswith("License is not valid for"):
-                        raise d42exc.LicenseInsufficientException(msg) from err
-                except js.JSONDecodeError:
-                    # Ignore JSON decode exception here. The backend may not
-                    # talk JSON when returning 500's.
-                    pass
+        except HTTP_ERRORS as err:
+            self._raise_license_error(err)
             raise
-        jres: tt.JSON_Res = res.json()
+        # orjson parses large Device42 payloads several times faster
+        # than the stdlib decoder behind res.json()
+        jres: tt.JSON_Res = (
+            orjson.loads(res.content) if orjson is not None else res.json()
+        )
         if method in ["POST", "PUT"]:
             return self._check_err(jres)
+        if cache_key is not None:
+            self._store_cached(cache_key, res, jres)
         return jres
 
     def _paginated_request(
@@ -86,21 +289,29 @@ class D42Client(BasicRestClient):
         json: t.Optional[t.Dict[str, t.Any]] = None,
         data: t.Optional[t.Dict[str, t.Any]] = None,
         limit: int = 50,
+        max_workers: int = 8,
     ) -> t.Iterable[tt.JSON_Res]:
+        """
+        Only the first page is fetched serially (we need its `total_count`
+        to know how many pages exist); the remaining offsets are then
+        requested concurrently and yielded as they complete.
+
+        Note that this means pages after the first may arrive out of
+        order. The session's connection pool is sized to accomodate
+        `max_workers` sockets.
+        """
+
         def page_request(new_params: t.Dict[str, t.Any]) -> tt.JSON_Dict:
-            return t.cast(
-                tt.JSON_Dict,
-                self._request(
-                    method=method,
-                    endpoint=endpoint,
-                    params=new_params,
-                    data=data,
-                    json=json,
-                ),
+            # _request returns JSON_Res (Any); the runtime cast it used
+            # to do cost a call per page for mypy's benefit only
+            return self._request(  # type: ignore[no-any-return]
+                method=method,
+                endpoint=endpoint,
+                params=new_params,
+                data=data,
+                json=json,
             )
 
-        request_num = 1
-
         params = {} if params is None else params
         params["limit"] = limit
         params["offset"] = 0
@@ -108,40 +319,136 @@ class D42Client(BasicRestClient):
         # First request
         resp = page_request(params)
         # Process data
-        resp_data: t.Any = extract_data(resp)
-        if not resp_data:
+        payload_key = self._payload_keys.get(endpoint)
+        if payload_key is None or payload_key not in resp:
+            payload_keys = resp.keys() - _META_KEYS
+            payload_key = next(iter(payload_keys), None)
+            if payload_key is not None:
+                self._payload_keys[endpoint] = payload_key
+        resp_data: t.Any = (
+            resp[payload_key] if payload_key is not None else None
+        )
+        if payload_key is None or not resp_data:
             # Sometimes, we'll run a paginated _request
             # and just get back []
             # In these cases, we want to quickly StopIteration
             return resp_data
 
-        total_count = tt.int_cast(resp.get("total_count"))
+        # total_count is always present on paginated payloads even
+        # though the JSON value union says it might not be
+        total_count = int(resp["total_count"])  # type: ignore[arg-type]
 
         yield resp_data
 
         processed = len(resp_data)
+        if processed >= total_count:
+            return
+
+        # Every remaining page is now a known (offset, limit) pair, so
+        # we can fire them all off at once
+        offsets = range(limit, total_count, limit)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        futures = [
+            executor.submit(page_request, {**params, "offset": offset})
+            for offset in offsets
+        ]
+        try:
+            for request_num, future in enumerate(as_completed(futures), 2):
+                resp_data = future.result().get(payload_key)
+                if not resp_data:
+                    # Buggy Device42 versions may return an empty page
+                    # before total_count is reached; don't yield it
+                    LOGGER.debug(
+                        f"Request #{request_num} returned an empty page "
+                        f"({processed}/{total_count} rows processed)"
+                    )
+                    continue
+                processed += len(resp_data)
+                LOGGER.debug(
+                    f"Processing request #{request_num}) "
+                    f"[Limit: {limit}] "
+                    f"{processed}/{total_count}"
+                )
+                yield resp_data
+        finally:
+            # If the consumer abandons the generator early (e.g. breaks
+            # out of the loop), don't block fetching the whole catalog:
+            # cancel everything that hasn't started before shutting the
+            # pool down. (shutdown(cancel_futures=...) is 3.9+.)
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _request_stream(
+        self,
+        endpoint: str,
+        params: t.Optional[t.Dict[str, t.Any]] = None,
+        item_path: str = "item",
+    ) -> t.Iterator[tt.JSON_Dict]:
+        """
+        GET `endpoint` and incrementally decode the array at `item_path`
+        (ijson notation, e.g. `"devices.item"`), yielding one row at a
+        time.
+
+        Unlike `_request` this never materializes the response body, so
+        memory stays O(one row) instead of O(page) — multi-MB
+        `get_all_devices` pages are parsed as they stream in. Responses
+        are deliberately not cached. Requires the `ijson` extra.
+        """
+        if ijson is None:
+            raise ImportError(
+                "Streaming requests require the ijson package "
+                "(pip install pydevice42[speedups])"
+            )
+        res = self.request(url=endpoint, params=params, stream=True)
+        try:
+            res.raise_for_status()
+            # requests leaves the raw stream compressed; let urllib3
+            # decode it on the fly for ijson
+            res.raw.decode_content = True
+            for row in ijson.items(res.raw, item_path):
+                yield row
+        finally:
+            res.close()
+
+    def _stream_paginated_request(
+        self,
+        endpoint: str,
+        params: t.Optional[t.Dict[str, t.Any]] = None,
+        limit: int = 50,
+    ) -> t.Iterator[tt.JSON_Dict]:
+        """
+        Memory-lean counterpart to `_flattened_paginated_request`.
 
-        while processed < total_count:
-            params["offset"] += limit
-            request_num += 1
-            LOGGER.debug(
-                f"Processing request #{request_num}) "
-                f"[Offset: {params['offset']} - Limit: {limit}] "
-                f"{len(resp_data)}/{total_count}"
+        A `limit=1` probe learns `total_count` and the payload field,
+        then each full page is stream-parsed with `_request_stream`.
+        Pages are fetched sequentially: this path trades the concurrent
+        fetcher's latency win for a flat memory profile.
+        """
+        params = {} if params is None else params
+        probe: tt.JSON_Dict = self._request(
+            endpoint=endpoint,
+            params={**params, "limit": 1, "offset": 0},
+        )
+        payload_keys = probe.keys() - _META_KEYS
+        if not payload_keys or not probe[next(iter(payload_keys))]:
+            return
+        payload_key = next(iter(payload_keys))
+        self._payload_keys[endpoint] = payload_key
+
+        total_count = int(probe["total_count"])  # type: ignore[arg-type]
+        for offset in range(0, total_count, limit):
+            yield from self._request_stream(
+                endpoint,
+                params={**params, "limit": limit, "offset": offset},
+                item_path=f"{payload_key}.item",
             )
-            resp = page_request(params)
-            resp_data = extract_data(resp)
-            processed += len(resp_data)
-            yield resp_data
 
     def _flattened_paginated_request(
         self, *args: t.Any, **kwargs: t.Any
-    ) -> t.Iterable[tt.JSON_Res]:
-        return chain.from_iterable(
-            t.cast(
-                t.List[tt.JSON_Res], self._paginated_request(*args, **kwargs)
-            )
-        )
+    ) -> t.Iterator[tt.JSON_Res]:
+        for page in self._paginated_request(*args, **kwargs):
+            yield from page
 
     def _get_object(
         self,
@@ -149,7 +456,9 @@ class D42Client(BasicRestClient):
         id: int,
         api_version: str = "1.0",
     ) -> t.Any:
-        return self._request(endpoint=f"/api/{api_version}/{endpoint}/{id}")
+        return self._request(
+            endpoint=self._prefix(endpoint, api_version) + str(id)
+        )
 
     def _post_object(
         self,
@@ -175,11 +484,11 @@ class D42Client(BasicRestClient):
         `Literals`
         """
 
-        return tt.PostRes(
-            *self._request(
-                endpoint=f"/api/{api_version}/{endpoint}/",
+        return tt.PostRes.from_response(
+            self._request(
+                endpoint=self._prefix(endpoint, api_version),
                 method="POST",
-                data=t.cast(t.Dict[str, t.Any], new_obj),
+                data=_json_bytes(new_obj),
             )
         )
 
@@ -194,26 +503,48 @@ class D42Client(BasicRestClient):
         The difference is that PUT is used exclusively for updating, whereas
         POST can be both update and create.
         """
-        return tt.PostRes(
-            *self._request(
-                endpoint=f"/api/{api_version}/{endpoint}/",
+        return tt.PostRes.from_response(
+            self._request(
+                endpoint=self._prefix(endpoint, api_version),
                 method="PUT",
-                data=t.cast(t.Dict[str, t.Any], new_obj),
+                data=_json_bytes(new_obj),
             )
         )
 
+    def _post_many(
+        self,
+        items: t.Iterable[t.Mapping[str, t.Any]],
+        endpoint: str,
+        api_version: str = "1.0",
+        max_workers: int = 8,
+    ) -> t.List[tt.PostRes]:
+        """
+        POST every mapping in `items` concurrently over the pooled
+        session, instead of paying one full round-trip each like a
+        `for obj in items: client._post_object(obj, ...)` loop does.
+
+        Results come back in input order. Note that the session's
+        transport-level retries don't apply here: urllib3's `Retry`
+        only retries idempotent methods by default, and POST isn't one
+        of them.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda obj: self._post_object(obj, endpoint, api_version),
+                    items,
+                )
+            )
+
     def _delete_object(
         self, endpoint: str, id: int, api_version: str = "1.0"
     ) -> tt.DeleteRes:
         """
         Generic DELETE
         """
-        return t.cast(
-            tt.DeleteRes,
-            self._request(
-                endpoint=f"/api/{api_version}/{endpoint}/{id}",
-                method="DELETE",
-            ),
+        return self._request(  # type: ignore[no-any-return]
+            endpoint=self._prefix(endpoint, api_version) + str(id),
+            method="DELETE",
         )
 
     def get_DOQL_query(self, query_name: str) -> t.Any:
@@ -226,12 +557,7 @@ class D42Client(BasicRestClient):
         return self._request(
             method="GET",
             endpoint="/services/data/v1.0/query/",
-            params={
-                "saved_query_name": query_name,
-                "delimiter": "",
-                "header": "yes",
-                "output_type": "json",
-            },
+            params=dict(_DOQL_BASE, saved_query_name=query_name),
         )
 
     def update_custom_field(
@@ -278,8 +604,8 @@ class D42Client(BasicRestClient):
 
         return self._request(
             method="PUT",
-            endpoint=f"/api/{api_version}/custom_fields/{endpoint}/",
-            data=t.cast(t.Dict[str, t.Any], cf),
+            endpoint=self._prefix(f"custom_fields/{endpoint}", api_version),
+            data=cf,
         )
 
     ###########################################################################
@@ -320,7 +646,9 @@ class D42Client(BasicRestClient):
         self,
         id: int,
     ) -> tt.Room:
-        return t.cast(tt.Room, self._get_object(endpoint="rooms", id=id))
+        return self._get_object(  # type: ignore[no-any-return]
+            endpoint="rooms", id=id
+        )
 
     def post_room(self, room: tt.Room) -> tt.PostRes:
         return self._post_object(room, "rooms")
@@ -342,7 +670,9 @@ class D42Client(BasicRestClient):
         self,
         id: int,
     ) -> tt.Rack:
-        return t.cast(tt.Rack, self._get_object(endpoint="racks", id=id))
+        return self._get_object(  # type: ignore[no-any-return]
+            endpoint="racks", id=id
+        )
 
     def post_rack(self, rack: tt.Rack) -> tt.PostRes:
         return self._post_object(rack, "racks")
@@ -360,23 +690,67 @@ class D42Client(BasicRestClient):
         )
 
     def get_all_devices(
-        self, include_cols: t.Optional[str] = None
-    ) -> t.Iterable[tt.Device]:
+        self,
+        include_cols: t.Optional[str] = None,
+        stream: bool = False,
+        as_dataclass: bool = False,
+    ) -> t.Iterable[t.Any]:
         """
         Apparently, get _all_ devices is a little more detailed than just
         devices. Who knew.
 
         Anyway, `include_cols` will limit the columns you want to display.
 
+        Pass `stream=True` to decode rows incrementally with ijson
+        instead of materializing whole pages (worth it for very large
+        inventories; needs the `speedups` extra).
+
+        Pass `as_dataclass=True` to get slotted record objects instead
+        of dicts — several times smaller per row, which matters if you
+        `list()` the whole inventory. Record types are derived from the
+        keys each row actually has, so no column is lost.
+
         See the documentation for more info:
         [here](https://api.device42.com/#!/Devices/getDevicesAll)
         """
-        return self._flattened_paginated_request(
-            "/api/1.0/devices/all", params={"include_cols": include_cols}
-        )
+        rows: t.Iterable[t.Any]
+        if stream:
+            rows = self._stream_paginated_request(
+                "/api/1.0/devices/all",
+                params={"include_cols": include_cols},
+            )
+        else:
+            rows = self._flattened_paginated_request(
+                "/api/1.0/devices/all", params={"include_cols": include_cols}
+            )
+        if as_dataclass:
+            return self._as_records("DeviceRecord", rows)
+        return rows
+
+    @staticmethod
+    def _as_records(
+        name: str, rows: t.Iterable[t.Mapping[str, t.Any]]
+    ) -> t.Iterator[t.Any]:
+        """
+        Wrap each row in a slotted record type built from the keys the
+        row actually carries (the `Device` TypedDict only models
+        request parameters, not response columns like `device_id`).
+        Types are cached per key set, so heterogeneous listings — e.g.
+        different `include_cols` — cost one class each, not one per row.
+        """
+        record_types: t.Dict[t.FrozenSet[str], t.Type[t.Any]] = {}
+        for row in rows:
+            keys = frozenset(row)
+            record_type = record_types.get(keys)
+            if record_type is None:
+                record_type = tt.make_record_type(name, row)
+                record_types[keys] = record_type
+            yield record_type(**row)
 
     def get_device(self, id: int, **kwargs: tt.DeviceGet) -> tt.Device:
-        return t.cast(tt.Device, self._get_object(endpoint="devices", id=id))
+        return self._get_object(  # type: ignore[no-any-return]
+            endpoint="devices", id=id
+        )
 
     def get_device_by_other_id(
         self,
@@ -408,14 +782,98 @@ class D42Client(BasicRestClient):
     def post_network(self, new_subnet: tt.Subnet) -> tt.JSON_Res:
         return self._post_object(new_subnet, "subnets")
 
+    def post_networks(
+        self, new_subnets: t.Iterable[tt.Subnet], max_workers: int = 8
+    ) -> t.List[tt.PostRes]:
+        return self._post_many(new_subnets, "subnets", max_workers=max_workers)
+
     def post_ip(self, new_ip: tt.IPAddress) -> tt.JSON_Res:
         return self._post_object(new_ip, "ips")
 
+    def post_ips(
+        self, new_ips: t.Iterable[tt.IPAddress], max_workers: int = 8
+    ) -> t.List[tt.PostRes]:
+        """
+        Batch variant of `post_ip` for the "loop over a CSV of IPs"
+        use case; see `_post_many`.
+        """
+        return self._post_many(new_ips, "ips", max_workers=max_workers)
+
     def post_app_component(
         self,
         new_component: tt.AppComponent,
     ) -> tt.JSON_Res:
         return self._post_object(new_component, "appcomps")
 
+    def post_app_components(
+        self,
+        new_components: t.Iterable[tt.AppComponent],
+        max_workers: int = 8,
+    ) -> t.List[tt.PostRes]:
+        return self._post_many(
+            new_components, "appcomps", max_workers=max_workers
+        )
+
     def post_customer(self, new_customer: tt.Customer) -> tt.JSON_Res:
         return self._post_object(new_customer, "customers")
+
+    def post_customers(
+        self, new_customers: t.Iterable[tt.Customer], max_workers: int = 8
+    ) -> t.List[tt.PostRes]:
+        return self._post_many(
+            new_customers, "customers", max_workers=max_workers
+        )
+
+
+# The simple POST helpers all have a fixed endpoint, yet funneled
+# through _post_object, which re-resolves the URL prefix and re-casts
+# the payload on every call. We specialize them once at import time
+# instead: each method below is compiled with its URL baked in as a
+# literal, so a call is just self._request plus the PostRes fast path.
+# The defs in the class body are kept — they're what mypy and
+# documentation see; only their implementation is swapped out here.
+# Caveat: the compiled bodies call self._request directly, so a
+# subclass that overrides _post_object won't affect these methods; such
+# a subclass should override the post_* methods themselves (or trim
+# _SPECIALIZED_POSTS).
+_SPECIALIZED_POSTS = {
+    "post_building": "buildings",
+    "post_room": "rooms",
+    "post_rack": "racks",
+    "post_network": "subnets",
+    "post_ip": "ips",
+    "post_app_component": "appcomps",
+    "post_customer": "customers",
+}
+
+
+def _compile_post_method(
+    name: str, url: str, param: str
+) -> t.Callable[..., tt.PostRes]:
+    namespace: t.Dict[str, t.Any] = {
+        "PostRes": tt.PostRes,
+        "_json_bytes": _json_bytes,
+    }
+    exec(
+        f"def {name}(self, {param}):\n"
+        f"    return PostRes.from_response(self._request(\n"
+        f"        endpoint={url!r}, method='POST',\n"
+        f"        data=_json_bytes({param}),\n"
+        f"    ))\n",
+        namespace,
+    )
+    fn: t.Callable[..., tt.PostRes] = namespace[name]
+    return fn
+
+
+for _name, _endpoint in _SPECIALIZED_POSTS.items():
+    _orig = getattr(D42Client, _name)
+    # Keep the class-body def's parameter name so keyword calls
+    # (e.g. post_ip(new_ip=...)) still work on the compiled version
+    _fn = _compile_post_method(
+        _name, f"/api/1.0/{_endpoint}/", _orig.__code__.co_varnames[1]
+    )
+    _fn.__doc__ = _orig.__doc__
+    _fn.__qualname__ = f"D42Client.{_name}"
+    setattr(D42Client, _name, _fn)
+del _name, _endpoint, _orig, _fn